@@ -4,6 +4,7 @@
 This prototype illustrates basic function calling with the OpenAI Responses API.
 """
 
+import asyncio
 import logging
 import os
 import random
@@ -31,7 +32,7 @@ def get_number() -> int:
     return random.randint(0, 100)
 
 
-def agent_loop():
+async def agent_loop():
     """Main loop for the agent"""
     logging.basicConfig(level=logging.INFO)
     # logging.basicConfig(level=logging.DEBUG)
@@ -45,15 +46,33 @@ def agent_loop():
     # Initialize the agent core
     llm = MinCore(api_key=api_key, system_prompt=SYSTEM_PROMPT)
 
+    # Bind the fixed function set once, outside the interaction loop
+    funcs = (get_color, get_number)
+    llm.bind_functions(funcs)
+
     # Main interaction loop
     response_id = None
-    funcs = (get_color, get_number)
-    while True:
-        user_input = input("\n>>> You: ")
-        print("")
-        response_id, response_text = llm.send_message(user_input, previous_response_id=response_id, functions=funcs)
-        print("\n>>> Agent: ", response_text)
+    loop = asyncio.get_running_loop()
+    try:
+        while True:
+            # Read stdin in a worker thread so the event loop stays free
+            user_input = await loop.run_in_executor(None, input, "\n>>> You: ")
+            print("")
+            # Stream the reply so tokens appear as they are generated
+            print("\n>>> Agent: ", end="", flush=True)
+            response_id, _ = await llm.send_message(user_input, previous_response_id=response_id, stream=True)
+            print("")
+    finally:
+        await llm.aclose()
 
 
 if __name__ == "__main__":
-    agent_loop()
+    # Use uvloop when available for faster socket I/O and task scheduling
+    # This must be installed before asyncio.run creates the event loop
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
+    asyncio.run(agent_loop())
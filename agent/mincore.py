@@ -17,13 +17,18 @@ from the openai-agents package instead:
 - https://github.com/openai/openai-agents-python?tab=readme-ov-file#functions-example
 """
 
-import functools
-import json
+import asyncio
+import inspect
 import logging
+import threading
+import time
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
+import httpx
+import orjson
 from function_schema import get_function_schema
-from openai import OpenAI
+from openai import AsyncOpenAI, RateLimitError
+from openai.types.responses import ResponseFunctionToolCall
 
 
 logger = logging.getLogger("mincore")
@@ -34,30 +39,77 @@ logger = logging.getLogger("mincore")
 # ----------------------------------------------------------------------------------------------------------------------
 
 
-@functools.lru_cache(maxsize=10)
-def _generate_function_schemas(function_list: List[Callable]) -> List[Dict[str, Any]]:
+# Sentinel a tool returns to declare that its output does not matter to the
+# conversation; it is also the output submitted for speculative next turns
+OUTPUT_NOT_NEEDED = "<output-not-needed>"
+
+
+def async_safe(function: Callable) -> Callable:
+    """Mark a function as safe for speculative (overlapped) execution
+
+    A function is async-safe when it is side-effect free and its output does
+    not need to be seen by the model before the next turn is decoded. For
+    rounds made up entirely of async-safe calls, send_message starts the next
+    model turn with OUTPUT_NOT_NEEDED as each call's output while the tools are
+    still running, hiding tool latency behind model decode latency. A tool
+    confirms the speculation by returning OUTPUT_NOT_NEEDED itself, in which
+    case the speculative turn stands and its transcript already matches what
+    would have been submitted; any other return value discards the speculative
+    turn and the next turn is re-issued with the real outputs.
+    """
+    function._async_safe = True
+    return function
+
+
+# Cache of prepared (schemas, map) tuples keyed by the function tuple itself,
+# so repeat send_message calls skip schema regeneration. Keying by the tuple
+# keeps short-lived tuples safe (an id() key could be recycled and serve
+# another tuple's functions), and hashing a small tuple costs no more than the
+# lookup. Bounded like the lru_cache it replaced.
+_FUNCTION_TOOLING_CACHE: Dict[Tuple[Callable[..., Any], ...], Tuple[List[Dict[str, Any]], Dict[str, Callable]]] = {}
+_FUNCTION_TOOLING_CACHE_MAXSIZE = 10
+
+
+def _get_function_tooling(functions: Tuple[Callable[..., Any], ...]) -> Tuple[List[Dict[str, Any]], Dict[str, Callable]]:
+    """Get the prepared function schemas and map for the given function tuple
+
+    Builds both on first sight of a function tuple and serves them from the
+    cache afterwards, evicting the oldest entry when the cache is full. The
+    schemas list is the identical object on every call, so the SDK receives
+    the same tools payload objects request after request.
+    """
+    cached = _FUNCTION_TOOLING_CACHE.get(functions)
+    if cached is None:
+        if len(_FUNCTION_TOOLING_CACHE) >= _FUNCTION_TOOLING_CACHE_MAXSIZE:
+            _FUNCTION_TOOLING_CACHE.pop(next(iter(_FUNCTION_TOOLING_CACHE)))
+        cached = _FUNCTION_TOOLING_CACHE[functions] = (_generate_function_schemas(functions), _generate_function_map(functions))
+    return cached
+
+
+def _generate_function_schemas(function_list: Tuple[Callable[..., Any], ...]) -> List[Dict[str, Any]]:
     """Generate the list of function schemas for the given function list
 
     This is auto-converted to JSON by the OpenAI client, and is the format which
     is expected by the OpenAI Responses API tools parameter.
     """
-    logger.debug(f"Generating function schemas for {len(function_list)} functions")
+    logger.debug("Generating function schemas for %d functions", len(function_list))
     function_schemas = []
     for function in function_list:
         schema = get_function_schema(function)
         schema["type"] = "function"
         function_schemas.append(schema)
-    logger.debug(f"Function schemas: {function_schemas}")
+    # The schemas dump is large, so skip even the lazy formatting unless needed
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Function schemas: %s", function_schemas)
     return function_schemas
 
 
-@functools.lru_cache(maxsize=10)
-def _generate_function_map(function_list: List[Callable]) -> Dict[str, Callable]:
+def _generate_function_map(function_list: Tuple[Callable[..., Any], ...]) -> Dict[str, Callable]:
     """Generate a dictionary of function names to functions
 
     This is used to map the function names in the OpenAI Responses API responses to the actual functions.
     """
-    logger.debug(f"Generating function map for {len(function_list)} functions")
+    logger.debug("Generating function map for %d functions", len(function_list))
     function_map = {}
     for function in function_list:
         function_map[function.__name__] = function
@@ -101,29 +153,61 @@ def _extract_function_calls(response: Any) -> List[Dict[str, Any]]:
         return calls
 
     for item in output:
-        # Duck-typing ResponseFunctionToolCall: requires name and arguments
-        name = getattr(item, "name", None)
-        arguments = getattr(item, "arguments", None)
-        if not name or arguments is None:
+        # Typed early filter: skips reasoning and message items without any
+        # per-attribute getattr probing
+        if not isinstance(item, ResponseFunctionToolCall):
             continue
 
-        call_id = getattr(item, "call_id", None) or getattr(item, "id", "")
+        call_id = item.call_id or item.id or ""
+        arguments = item.arguments
 
         if isinstance(arguments, str):
             try:
-                args = json.loads(arguments)
-            except Exception:
+                args = orjson.loads(arguments)
+            except orjson.JSONDecodeError:
                 args = {}
         elif isinstance(arguments, dict):
             args = arguments
         else:
             args = {}
 
-        calls.append({"id": str(call_id) if call_id is not None else "", "name": str(name), "args": args})
+        calls.append({"id": str(call_id), "name": item.name, "args": args})
 
     return calls
 
 
+async def _invoke_function_call(call: Dict[str, Any], function_map: Dict[str, Callable]) -> Dict[str, str]:
+    """Execute a single requested function call and capture the result
+
+    Coroutine functions are awaited directly; plain functions are run in the
+    default threadpool so slow or blocking tools don't stall the event loop.
+    Errors are captured into the result rather than raised, so a failing tool
+    is reported back to the LLM instead of aborting the round.
+    """
+    name = call["name"]
+    args = call["args"]
+    call_id = call["id"]
+
+    try:
+        logger.info("Executing function: %s with args: %s", name, args)
+        if name not in function_map:
+            raise ValueError(f"Unknown function: {name}")
+        function = function_map[name]
+        if inspect.iscoroutinefunction(function):
+            result = await function(**args)
+        else:
+            result = await asyncio.to_thread(function, **args)
+        logger.info("Function: %s executed with result: %s", name, result)
+    except Exception as e:
+        logger.error("Function: %s execution failed: %s", name, e)
+        result = {"error": str(e)}
+
+    # Convert result to string and return in the shape the API expects as input,
+    # so no reshaping pass is needed before the next request
+    output_str = orjson.dumps(result, default=str).decode() if isinstance(result, (dict, list)) else str(result)
+    return {"type": "function_call_output", "call_id": call_id, "output": output_str}
+
+
 # ----------------------------------------------------------------------------------------------------------------------
 #  LLM interaction class
 # ----------------------------------------------------------------------------------------------------------------------
@@ -132,6 +216,9 @@ DEFAULT_SYSTEM_PROMPT = """
 You are a helpful assistant.
 """
 
+# Maximum retries of a single rate-limited API request before giving up
+_MAX_RATE_LIMIT_RETRIES = 5
+
 
 class MinCore:
     """The inner core of an agent
@@ -139,116 +226,345 @@ class MinCore:
     This class handles the LLM interactions with function calling using the OpenAI Responses API
     """
 
-    def __init__(self, api_key: str, model: str = "gpt-5-nano", system_prompt: str = DEFAULT_SYSTEM_PROMPT):
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-5-nano",
+        system_prompt: str = DEFAULT_SYSTEM_PROMPT,
+        max_concurrency: int = 8,
+        max_requests_per_minute: Optional[int] = None,
+    ):
         """Initialize the client
 
         Args:
             api_key: The OpenAI API key to use
             model: The model to use (default: "gpt-5")
             system_prompt: The system prompt to use (default: DEFAULT_SYSTEM_PROMPT)
+            max_concurrency: Maximum in-flight messages for send_messages (default 8)
+            max_requests_per_minute: Request-rate budget shared by send_messages (default None, unlimited)
         """
-        self.client = OpenAI(api_key=api_key)
+        # Share one HTTP/2 connection pool across all requests so the tight
+        # responses.create loop never re-pays the TCP+TLS handshake
+        self._http = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64, keepalive_expiry=60),
+            timeout=httpx.Timeout(60.0, connect=5.0),
+        )
+        self.client = AsyncOpenAI(api_key=api_key, http_client=self._http)
         self.model = model
         self.system_prompt = system_prompt
+        self._function_schemas: Optional[List[Dict[str, Any]]] = None
+        self._function_map: Optional[Dict[str, Callable]] = None
+        self._send_semaphore = asyncio.Semaphore(max_concurrency)
+        self._sync_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.max_requests_per_minute = max_requests_per_minute
+        self._available_request_capacity = float(max_requests_per_minute or 0)
+        self._last_capacity_refill = time.monotonic()
+
+    async def _await_request_capacity(self) -> None:
+        """Wait until the per-minute request budget allows another API request
+
+        This is a token bucket refilled continuously at max_requests_per_minute;
+        it is a no-op when no rate limit was configured.
+        """
+        if not self.max_requests_per_minute:
+            return
+        while True:
+            now = time.monotonic()
+            refill = (now - self._last_capacity_refill) * self.max_requests_per_minute / 60.0
+            self._available_request_capacity = min(self._available_request_capacity + refill, float(self.max_requests_per_minute))
+            self._last_capacity_refill = now
+            if self._available_request_capacity >= 1.0:
+                self._available_request_capacity -= 1.0
+                return
+            await asyncio.sleep(60.0 / self.max_requests_per_minute)
+
+    async def send_messages(
+        self,
+        user_messages: List[str],
+        previous_response_ids: Optional[List[Optional[str]]] = None,
+        functions: Optional[Tuple[Callable[..., Any], ...]] = None,
+        max_function_rounds: int = 5,
+    ) -> List[Tuple[str, str]]:
+        """Send many independent messages concurrently
 
-    def _create_conversation(self) -> str:
-        """Create a new conversation with the given system prompt
+        Fans the messages out with asyncio.gather under the instance's
+        concurrency limit, so throughput scales with max_concurrency until the
+        API rate limit is reached. The request-rate budget and rate-limit
+        retries are applied per API request inside _create_response.
+
+        Args:
+            user_messages: The user messages to send, one per conversation
+            previous_response_ids: Matching response IDs to continue conversations (None for all-new conversations)
+            functions: Functions available to the LLM (None to use the functions set via bind_functions)
+            max_function_rounds: Maximum number of function calling rounds per message (default 5)
 
         Returns:
-            str: The response ID that can be used for future messages
+            List[Tuple[str, str]]: The (response ID, text) pairs, in input order
         """
-        # Create initial response with system prompt
-        response = self.client.responses.create(
-            model=self.model,
-            input=[{"role": "system", "content": self.system_prompt}],
+        if previous_response_ids is None:
+            previous_response_ids = [None] * len(user_messages)
+        if len(previous_response_ids) != len(user_messages):
+            raise ValueError(f"Expected {len(user_messages)} previous_response_ids, got {len(previous_response_ids)}")
+
+        async def _send_one(user_message: str, previous_response_id: Optional[str]) -> Tuple[str, str]:
+            async with self._send_semaphore:
+                return await self.send_message(
+                    user_message,
+                    previous_response_id=previous_response_id,
+                    functions=functions,
+                    max_function_rounds=max_function_rounds,
+                )
+
+        coros = [_send_one(message, response_id) for message, response_id in zip(user_messages, previous_response_ids)]
+        return await asyncio.gather(*coros)
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool"""
+        await self._http.aclose()
+
+    def bind_functions(self, functions: Tuple[Callable[..., Any], ...]) -> None:
+        """Bind a fixed set of functions to this instance
+
+        Precomputes the function schemas and map once so that send_message
+        does no per-turn schema work at all. Bound functions are used whenever
+        send_message is called without an explicit functions argument.
+
+        Args:
+            functions: The functions to make available to the LLM
+        """
+        self._function_schemas, self._function_map = _get_function_tooling(functions)
+
+    def _ensure_sync_loop(self) -> asyncio.AbstractEventLoop:
+        """Get the persistent background event loop used by send_message_sync
+
+        The loop is created on first use and runs on a daemon thread for the
+        life of the process.
+        """
+        if self._sync_loop is None:
+            self._sync_loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=self._sync_loop.run_forever, name="mincore-sync", daemon=True)
+            thread.start()
+        return self._sync_loop
+
+    def send_message_sync(
+        self,
+        user_message: str,
+        previous_response_id: Optional[str] = None,
+        functions: Optional[Tuple[Callable[..., Any], ...]] = None,
+        max_function_rounds: int = 5,
+        stream: bool = False,
+        store: bool = True,
+    ) -> Tuple[str, str]:
+        """Synchronous wrapper around send_message for non-async callers
+
+        Runs the coroutine on a persistent background event loop so repeated
+        calls keep reusing the same HTTP connection pool. Drive an instance
+        either through this wrapper or through the async API, not both, since
+        the connection pool binds to whichever event loop uses it first.
+        """
+        future = asyncio.run_coroutine_threadsafe(
+            self.send_message(
+                user_message,
+                previous_response_id=previous_response_id,
+                functions=functions,
+                max_function_rounds=max_function_rounds,
+                stream=stream,
+                store=store,
+            ),
+            self._ensure_sync_loop(),
         )
-        return response.id
+        return future.result()
+
+    async def _create_response(self, stream: bool, **create_kwargs: Any) -> Any:
+        """Issue one model turn, optionally streaming output text to stdout
 
-    def send_message(
+        When streaming, text deltas are printed as they arrive and the full
+        Response object is still returned, so the caller handles streamed and
+        non-streamed turns identically. Tool-calling turns produce no text
+        deltas, so streaming them prints nothing.
+
+        Every attempt first awaits the per-minute request budget, and a
+        rate-limited request is retried with exponential backoff a bounded
+        number of times before the error propagates. Retrying here re-issues
+        only the single API request, never any already-executed tools.
+        """
+        backoff = 1.0
+        for attempt in range(_MAX_RATE_LIMIT_RETRIES + 1):
+            await self._await_request_capacity()
+            try:
+                if not stream:
+                    return await self.client.responses.create(**create_kwargs)
+                async with self.client.responses.stream(**create_kwargs) as event_stream:
+                    async for event in event_stream:
+                        if event.type == "response.output_text.delta":
+                            print(event.delta, end="", flush=True)
+                    return await event_stream.get_final_response()
+            except RateLimitError:
+                if attempt == _MAX_RATE_LIMIT_RETRIES:
+                    raise
+                logger.warning("Rate limited, backing off for %.1fs", backoff)
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2.0, 60.0)
+
+    async def send_message(
         self,
         user_message: str,
         previous_response_id: Optional[str] = None,
-        functions: Tuple[Callable[..., Any], ...] = (),
+        functions: Optional[Tuple[Callable[..., Any], ...]] = None,
         max_function_rounds: int = 5,
+        stream: bool = False,
+        store: bool = True,
     ) -> Tuple[str, str]:
         """Send a message with function calling using the Responses API
 
         Args:
             user_message: The next user message to send
             previous_response_id: The ID from a previous response to continue that conversation (None for new conversation)
-            functions: List of functions available to the LLM
+            functions: Functions available to the LLM (None to use the functions set via bind_functions)
             max_function_rounds: Maximum number of function calling rounds (default 5)
+            stream: Print output text to stdout as it is generated (default False)
+            store: Persist terminal responses server-side (default True). Pass False only when
+                the returned response ID will not be used to continue the conversation; responses
+                in the middle of a function calling exchange are always stored since their IDs
+                chain the next request
 
         Returns:
             Tuple[str, str]: The new response ID and text
         """
-        # Bootstrap the conversation
-        if previous_response_id is None:
-            logger.info("Bootstrapping conversation")
-            previous_response_id = self._create_conversation()
-
-        # Prepare the function schemas and map
-        function_schemas = None
-        function_map = None
+        # Prepare the function schemas and map, preferring the bound set
+        function_schemas = self._function_schemas
+        function_map = self._function_map
         if functions:
-            logger.debug("Functions provided, generating function schemas and map")
-            function_schemas = _generate_function_schemas(functions)
-            function_map = _generate_function_map(functions)
+            logger.debug("Functions provided, preparing function schemas and map")
+            function_schemas, function_map = _get_function_tooling(functions)
 
         # Send the next user message with functions available
+        # For a new conversation, fold the system prompt into this same request so
+        # the bootstrap costs no dedicated round-trip
         logger.info("Sending user message with functions to LLM")
         user_input = [{"role": "user", "content": user_message}]
-        response = self.client.responses.create(
+        if previous_response_id is None:
+            logger.info("Bootstrapping conversation")
+            user_input.insert(0, {"role": "system", "content": self.system_prompt})
+
+        # Fast path: with no functions available a single model turn answers the
+        # message, skipping all function calling bookkeeping
+        if not function_schemas:
+            # This response is terminal within this call, so it can skip the
+            # server-side write when the caller opted out of storage
+            response = await self._create_response(
+                stream,
+                model=self.model,
+                previous_response_id=previous_response_id,
+                input=user_input,
+                store=store,
+            )
+            return response.id, response.output_text
+
+        # This response may request function calls, in which case its ID chains the
+        # follow-up request, so it must stay stored
+        response = await self._create_response(
+            stream,
             model=self.model,
             previous_response_id=previous_response_id,
             input=user_input,
             tools=function_schemas,
+            parallel_tool_calls=True,
         )
         logger.debug("Initial message with functions sent to LLM")
 
+        # Fast path: the model answered directly without requesting any functions
+        function_calls = _extract_function_calls(response)
+        if not function_calls:
+            logger.debug("No function calls found in response, skipping function calling loop")
+            return response.id, response.output_text
+
         # ------------------------------------------------------------------------------------------
         # Function calling loop
         # ------------------------------------------------------------------------------------------
         # If requested by the LLM, call functions iteratively up to the maximum number of rounds
+        seen_call_signatures: set = set()
         for _ in range(max_function_rounds):
-            # Extract any function calls from the response
-            function_calls = _extract_function_calls(response)
-            if not function_calls:
-                logger.debug("No function calls found in response, stopping function calling loop")
+            # Stop early if the model is looping, repeating only calls it has
+            # already made with identical arguments; each wasted round costs a
+            # full network plus inference round-trip
+            round_signatures = {(call["name"], orjson.dumps(call["args"], option=orjson.OPT_SORT_KEYS)) for call in function_calls}
+            if round_signatures.issubset(seen_call_signatures):
+                logger.warning("Model repeated an identical round of function calls, stopping function calling loop")
+                # Answer the pending calls with an explanatory output instead of
+                # re-running them, without offering tools, so the model wraps up with
+                # text and the returned response ID stays usable as previous_response_id
+                repeat_notice = "Function call not executed: this exact call was already made and the function calling loop was stopped"
+                notice_outputs = [{"type": "function_call_output", "call_id": call["id"], "output": repeat_notice} for call in function_calls]
+                response = await self._create_response(
+                    stream,
+                    model=self.model,
+                    previous_response_id=response.id,
+                    input=notice_outputs,
+                )
                 break
-
-            # Execute the requested functions and capture the results
-            function_call_results: List[Dict[str, str]] = []
-            for call in function_calls:
-                name = call["name"]
-                args = call["args"]
-                call_id = call["id"]
-
-                try:
-                    logger.info(f"Executing function: {name} with args: {args}")
-                    if name not in function_map:
-                        raise ValueError(f"Unknown function: {name}")
-                    result = function_map[name](**args)
-                    logger.info(f"Function: {name} executed with result: {result}")
-                except Exception as e:
-                    logger.error(f"Function: {name} execution failed: {e}")
-                    result = {"error": str(e)}
-
-                # Convert result to string for API input
-                output_str = json.dumps(result, default=str) if isinstance(result, (dict, list)) else str(result)
-                function_call_results.append({"call_id": call_id, "output": output_str})
-
-            # Format the function call results to be used as input for the next request
-            function_call_results_formatted = [
-                {"type": "function_call_output", "call_id": result["call_id"], "output": result["output"]} for result in function_call_results
-            ]
+            seen_call_signatures |= round_signatures
+
+            # Execute the requested functions concurrently and capture the results
+            # The Responses API may request several independent calls per round, so the
+            # round cost is the slowest call rather than the sum of all of them
+            tasks = [asyncio.create_task(_invoke_function_call(call, function_map)) for call in function_calls]
+
+            # Speculative overlap: when every call in the round is marked async-safe,
+            # start the next model turn with OUTPUT_NOT_NEEDED outputs while the tools
+            # run, so tool latency hides behind model decode latency
+            speculative = None
+            if all(getattr(function_map.get(call["name"]), "_async_safe", False) for call in function_calls):
+                logger.debug("All calls async-safe, issuing speculative next turn")
+                speculative_outputs = [
+                    {"type": "function_call_output", "call_id": call["id"], "output": OUTPUT_NOT_NEEDED} for call in function_calls
+                ]
+                speculative = asyncio.create_task(
+                    self._create_response(
+                        False,
+                        model=self.model,
+                        previous_response_id=response.id,
+                        input=speculative_outputs,
+                        tools=function_schemas,
+                        parallel_tool_calls=True,
+                    )
+                )
+
+            function_call_results: List[Dict[str, str]] = await asyncio.gather(*tasks)
+
+            if speculative is not None:
+                speculative_response = await speculative
+                if all(result["output"] == OUTPUT_NOT_NEEDED for result in function_call_results):
+                    # Every tool declared its output irrelevant, so the speculative turn
+                    # stands and its transcript matches what would have been submitted
+                    # Speculative turns are never streamed, so emit any text after the fact
+                    logger.debug("Speculative turn confirmed")
+                    response = speculative_response
+                    if stream and response.output_text:
+                        print(response.output_text, end="", flush=True)
+                    function_calls = _extract_function_calls(response)
+                    if not function_calls:
+                        break
+                    continue
+                # Some tool produced a real output; discard the speculative turn and
+                # fall through to re-issue the next turn with the real outputs
+                logger.debug("Speculative turn discarded, re-issuing with real outputs")
 
             # Continue the conversation with function results
-            response = self.client.responses.create(
+            # The results are already API-shaped, so they feed the next request directly
+            response = await self._create_response(
+                stream,
                 model=self.model,
                 previous_response_id=response.id,
-                input=function_call_results_formatted,
+                input=function_call_results,
             )
+
+            # Extract any further function calls from the response
+            function_calls = _extract_function_calls(response)
+            if not function_calls:
+                logger.debug("No function calls found in response, stopping function calling loop")
+                break
         # ------------------------------------------------------------------------------------------
         # End of function calling loop
         # ------------------------------------------------------------------------------------------